@@ -60,6 +60,30 @@ DTYPES = {
     np.datetime64: "GMT_DATETIME",
 }
 
+# The shared library and the ctypes functions that have already had their
+# argument and return types configured. Loaded lazily by
+# Session.get_libgmt_func and shared by all sessions so that we don't have to
+# reload libgmt and reassign the ctypes prototypes on every API call.
+_LIBGMT = None
+_LIBGMT_FUNCS = {}
+# Values of the GMT constants (C enums) that have already been looked up. They
+# don't change while the library is loaded, so there's no need to call
+# GMT_Get_Enum every time one is needed (e.g., on every call_module).
+_LIBGMT_ENUMS = {}
+# The 'info' dict of the first session opened in a 'with' block. The paths and
+# parameters don't change while the library is loaded, so other sessions reuse
+# it instead of calling GMT_Get_Default for each of them again.
+_LIBGMT_INFO = None
+
+# The name given to all sessions opened in a 'with' block, already encoded so
+# that it doesn't have to be converted every time a session is created.
+SESSION_NAME = b"pygmt-session"
+
+# The name of the figure that is currently active in the modern mode session.
+# Set by Session.call_module when it runs the "figure" module and reset by
+# "begin" and "end". None if no figure is known to be active.
+_ACTIVE_FIGURE = None
+
 
 class Session:
     """
@@ -144,6 +168,18 @@ class Session:
         """
         self._session_pointer = session
 
+    @property
+    def active_figure(self):
+        """
+        The name of the figure that is currently active in the modern mode
+        session.
+
+        Updated by :meth:`~pygmt.clib.Session.call_module` every time the
+        ``figure`` module is called and reset to ``None`` by ``begin`` and
+        ``end``. Shared by all sessions and available without an open one.
+        """
+        return _ACTIVE_FIGURE
+
     @property
     def info(self):
         "Dictionary with the GMT version and default paths and parameters."
@@ -178,10 +214,10 @@ class Session:
             raising the exception.
 
         """
-        self.create("pygmt-session")
-        # Need to store the version info because 'get_default' won't work after
-        # the session is destroyed.
-        version = self.info["version"]
+        global _LIBGMT_INFO  # pylint: disable=global-statement
+
+        self.create(SESSION_NAME)
+        version = self.get_default("API_VERSION")
         if Version(version) < Version(self.required_version):
             self.destroy()
             raise GMTVersionError(
@@ -189,6 +225,11 @@ class Session:
                     version, self.required_version
                 )
             )
+        # Need to store the info because 'get_default' won't work after the
+        # session is destroyed. Only the version is queried for every session.
+        if _LIBGMT_INFO is None:
+            _LIBGMT_INFO = self.info
+        self._info = dict(_LIBGMT_INFO, version=version)
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
@@ -204,7 +245,7 @@ class Session:
         Get the value of a GMT constant (C enum) from gmt_resources.h
 
         Used to set configuration values for other API calls. Wraps
-        ``GMT_Get_Enum``.
+        ``GMT_Get_Enum``. Values are cached after the first lookup.
 
         Parameters
         ----------
@@ -223,6 +264,9 @@ class Session:
             If the constant doesn't exist.
 
         """
+        if name in _LIBGMT_ENUMS:
+            return _LIBGMT_ENUMS[name]
+
         c_get_enum = self.get_libgmt_func(
             "GMT_Get_Enum", argtypes=[ctp.c_void_p, ctp.c_char_p], restype=ctp.c_int
         )
@@ -239,13 +283,17 @@ class Session:
         if value is None or value == -99999:
             raise GMTCLibError(f"Constant '{name}' doesn't exist in libgmt.")
 
+        _LIBGMT_ENUMS[name] = value
         return value
 
     def get_libgmt_func(self, name, argtypes=None, restype=None):
         """
         Get a ctypes function from the libgmt shared library.
 
-        Assigns the argument and return type conversions for the function.
+        Assigns the argument and return type conversions for the function. The
+        library is only loaded once and the configured function is cached, so
+        the conversions are only assigned the first time a function is
+        requested.
 
         Use this method to access a C function from libgmt.
 
@@ -276,13 +324,17 @@ class Session:
         <class 'ctypes.CDLL.__init__.<locals>._FuncPtr'>
 
         """
-        if not hasattr(self, "_libgmt"):
-            self._libgmt = load_libgmt()
-        function = getattr(self._libgmt, name)
+        global _LIBGMT  # pylint: disable=global-statement
+        if name in _LIBGMT_FUNCS:
+            return _LIBGMT_FUNCS[name]
+        if _LIBGMT is None:
+            _LIBGMT = load_libgmt()
+        function = getattr(_LIBGMT, name)
         if argtypes is not None:
             function.argtypes = argtypes
         if restype is not None:
             function.restype = restype
+        _LIBGMT_FUNCS[name] = function
         return function
 
     def create(self, name):
@@ -308,7 +360,7 @@ class Session:
 
         Parameters
         ----------
-        name : str
+        name : str or bytes
             A name for this session. Doesn't really affect the outcome.
 
         """
@@ -357,7 +409,9 @@ class Session:
         padding = self["GMT_PAD_DEFAULT"]
         session_type = self["GMT_SESSION_EXTERNAL"]
 
-        session = c_create_session(name.encode(), padding, session_type, print_func)
+        if isinstance(name, str):
+            name = name.encode()
+        session = c_create_session(name, padding, session_type, print_func)
 
         if session is None:
             raise GMTCLibError(
@@ -476,9 +530,9 @@ class Session:
 
         Parameters
         ----------
-        module : str
+        module : str or bytes
             Module name (``'coast'``, ``'basemap'``, etc).
-        args : str
+        args : str or bytes
             String with the command line arguments that will be passed to the
             module (for example, ``'-R0/5/0/10 -JM'``).
 
@@ -494,16 +548,25 @@ class Session:
             restype=ctp.c_int,
         )
 
+        global _ACTIVE_FIGURE  # pylint: disable=global-statement
+
         mode = self["GMT_MODULE_CMD"]
-        status = c_call_module(
-            self.session_pointer, module.encode(), mode, args.encode()
-        )
+        # Avoid encoding names and arguments that are already bytes
+        c_module = module.encode() if isinstance(module, str) else module
+        c_args = args.encode() if isinstance(args, str) else args
+        if c_module in (b"figure", b"begin", b"end"):
+            # We don't know which figure is active if these modules fail
+            _ACTIVE_FIGURE = None
+        status = c_call_module(self.session_pointer, c_module, mode, c_args)
         if status != 0:
             raise GMTCLibError(
                 "Module '{}' failed with status code {}:\n{}".format(
-                    module, status, self._error_message
+                    c_module.decode(), status, self._error_message
                 )
             )
+        if c_module == b"figure":
+            # The first argument of the figure module is the figure name
+            _ACTIVE_FIGURE = c_args.split()[0].decode()
 
     def create_data(self, family, geometry, mode, **kwargs):
         """
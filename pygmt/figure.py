@@ -2,6 +2,7 @@
 Define the Figure class that handles all plotting.
 """
 import os
+import contextlib
 from tempfile import TemporaryDirectory
 import base64
 
@@ -27,6 +28,23 @@ from .helpers import (
 # This is needed for the sphinx-gallery scraper in pygmt/sphinx_gallery.py
 SHOWED_FIGURES = []
 
+# Names of the modules called by the Figure methods, encoded once so that they
+# don't have to be converted on every call.
+_MODULE_FIGURE = b"figure"
+_MODULE_PSCONVERT = b"psconvert"
+
+# Previews are only read back into memory, so keep them on a RAM-backed file
+# system when one is available (Linux). None falls back to the default
+# temporary directory of the system.
+if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+    _PREVIEW_ROOT = "/dev/shm"
+else:
+    _PREVIEW_ROOT = None
+
+# The temporary directory shared by all figures to store their previews.
+# Created on the first preview and removed when Python exits.
+_PREVIEW_DIR = None
+
 
 class Figure(BasePlotting):
     """
@@ -64,13 +82,16 @@ class Figure(BasePlotting):
 
     def __init__(self):
         self._name = unique_name()
-        self._preview_dir = TemporaryDirectory(prefix=self._name + "-preview-")
+        # The preview files that this figure has generated (see _preview)
+        self._previews = set()
         self._activate_figure()
 
     def __del__(self):
-        # Clean up the temporary directory that stores the previews
-        if hasattr(self, "_preview_dir"):
-            self._preview_dir.cleanup()
+        # Clean up the preview files from the shared preview directory
+        for fname in getattr(self, "_previews", ()):
+            # The shared directory might have been removed already (at exit)
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(fname)
 
     def _activate_figure(self):
         """
@@ -82,11 +103,16 @@ class Figure(BasePlotting):
         trigger the generation of a figure file. An explicit call to
         :meth:`pygmt.Figure.savefig` or :meth:`pygmt.Figure.psconvert` must be
         made in order to get a file.
+
+        Does nothing if this figure is already the active one (see
+        :attr:`pygmt.clib.Session.active_figure`).
         """
+        if Session().active_figure == self._name:
+            return
         # Passing format '-' tells pygmt.end to not produce any files.
         fmt = "-"
         with Session() as lib:
-            lib.call_module("figure", "{} {}".format(self._name, fmt))
+            lib.call_module(_MODULE_FIGURE, "{} {}".format(self._name, fmt))
 
     def _preprocess(self, **kwargs):
         """
@@ -166,12 +192,14 @@ class Figure(BasePlotting):
             PS or PDF files. It requires the *prefix* option.
 
         """
-        kwargs = self._preprocess(**kwargs)
+        # Without input files, psconvert converts the active figure, so this
+        # figure must still be selected. This is a no-op if it already is.
+        self._activate_figure()
         # Default cropping the figure to True
         if "A" not in kwargs:
             kwargs["A"] = ""
         with Session() as lib:
-            lib.call_module("psconvert", build_arg_string(kwargs))
+            lib.call_module(_MODULE_PSCONVERT, build_arg_string(kwargs))
 
     def savefig(
         self, fname, transparent=False, crop=True, anti_alias=True, show=False, **kwargs
@@ -357,7 +385,14 @@ class Figure(BasePlotting):
             file. Else, it is the file content loaded as a bytes string.
 
         """
-        fname = os.path.join(self._preview_dir.name, "{}.{}".format(self._name, fmt))
+        global _PREVIEW_DIR  # pylint: disable=global-statement
+        if _PREVIEW_DIR is None:
+            _PREVIEW_DIR = TemporaryDirectory(
+                prefix="pygmt-preview-", dir=_PREVIEW_ROOT
+            )
+        # Previews of the same figure and format overwrite the same file
+        fname = os.path.join(_PREVIEW_DIR.name, "{}.{}".format(self._name, fmt))
+        self._previews.add(fname)
         self.savefig(fname, dpi=dpi, **kwargs)
         if as_bytes:
             with open(fname, "rb") as image:
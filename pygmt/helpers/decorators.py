@@ -215,6 +215,10 @@ def use_alias(**aliases):
         Arguments in short-form (J) and long-form (projection) can't coexist
     """
 
+    # Map the aliases back to the argument names so that each call only has to
+    # look at the keyword arguments it was given, not at every alias.
+    short_forms = {alias: arg for arg, alias in aliases.items()}
+
     def alias_decorator(module_func):
         """
         Decorator that replaces the aliases for arguments.
@@ -225,13 +229,13 @@ def use_alias(**aliases):
             """
             New module that parses and replaces the registered aliases.
             """
-            for arg, alias in aliases.items():
-                if alias in kwargs and arg in kwargs:
+            for alias in [key for key in kwargs if key in short_forms]:
+                arg = short_forms[alias]
+                if arg in kwargs:
                     raise GMTInvalidInput(
                         f"Arguments in short-form ({arg}) and long-form ({alias}) can't coexist"
                     )
-                if alias in kwargs:
-                    kwargs[arg] = kwargs.pop(alias)
+                kwargs[arg] = kwargs.pop(alias)
             return module_func(*args, **kwargs)
 
         new_module.aliases = aliases
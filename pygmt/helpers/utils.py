@@ -133,11 +133,11 @@ def build_arg_string(kwargs):
     """
     sorted_args = []
     for key in sorted(kwargs):
-        if is_nonstr_iter(kwargs[key]):
-            for value in kwargs[key]:
-                sorted_args.append("-{}{}".format(key, value))
+        value = kwargs[key]
+        if is_nonstr_iter(value):
+            sorted_args.extend(f"-{key}{item}" for item in value)
         else:
-            sorted_args.append("-{}{}".format(key, kwargs[key]))
+            sorted_args.append(f"-{key}{value}")
 
     arg_str = " ".join(sorted_args)
     return arg_str
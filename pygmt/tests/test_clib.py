@@ -3,6 +3,7 @@
 Test the wrappers for the C API.
 """
 import os
+import ctypes as ctp
 from contextlib import contextmanager
 
 import numpy as np
@@ -81,6 +82,32 @@ def test_getitem():
         ses["A_WHOLE_LOT_OF_JUNK"]  # pylint: disable=pointless-statement
 
 
+def test_get_libgmt_func_cached():
+    "Test that all sessions share the same configured libgmt functions"
+    ses1 = clib.Session()
+    ses2 = clib.Session()
+    func1 = ses1.get_libgmt_func(
+        "GMT_Call_Module",
+        argtypes=[ctp.c_void_p, ctp.c_char_p, ctp.c_int, ctp.c_void_p],
+        restype=ctp.c_int,
+    )
+    func2 = ses2.get_libgmt_func(
+        "GMT_Call_Module",
+        argtypes=[ctp.c_void_p, ctp.c_char_p, ctp.c_int, ctp.c_void_p],
+        restype=ctp.c_int,
+    )
+    assert func1 is func2
+
+
+def test_getitem_cached():
+    "Test that constants are only looked up once in the C lib"
+    ses = clib.Session()
+    value = ses["GMT_MODULE_CMD"]
+    # A failing GMT_Get_Enum would raise an exception if it were called again
+    with mock(ses, "GMT_Get_Enum", returns=-99999):
+        assert ses["GMT_MODULE_CMD"] == value
+
+
 def test_create_destroy_session():
     "Test that create and destroy session are called without errors"
     # Create two session and make sure they are not pointing to the same memory
@@ -141,6 +168,17 @@ def test_call_module():
             assert output == "11.5309 61.7074 -2.9289 7.8648 0.1412 0.9338"
 
 
+def test_call_module_bytes():
+    "Run call_module with module name and arguments already encoded"
+    data_fname = os.path.join(TEST_DATA_DIR, "points.txt")
+    with clib.Session() as lib:
+        with GMTTempFile() as out_fname:
+            args = "{} -C ->{}".format(data_fname, out_fname.name)
+            lib.call_module(b"info", args.encode())
+            output = out_fname.read().strip()
+            assert output == "11.5309 61.7074 -2.9289 7.8648 0.1412 0.9338"
+
+
 def test_call_module_invalid_arguments():
     "Fails for invalid module arguments"
     with clib.Session() as lib:
@@ -721,6 +759,14 @@ def test_info_dict():
     ses.destroy()
 
 
+def test_info_dict_after_exit():
+    "Make sure the clib.Session.info dict can be read after the session ends."
+    with clib.Session() as lib:
+        info = dict(lib.info)
+    assert lib.info == info
+    assert Version(lib.info["version"]) >= Version("6.1.0")
+
+
 def test_fails_for_wrong_version():
     "Make sure the clib.Session raises an exception if GMT is too old"
 
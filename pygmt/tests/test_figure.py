@@ -1,3 +1,4 @@
+# pylint: disable=protected-access
 """
 Test the behaviors of the Figure class
 Doesn't include the plotting commands, which have their own test files.
@@ -8,7 +9,7 @@ import numpy as np
 import numpy.testing as npt
 import pytest
 
-from .. import Figure
+from .. import Figure, clib
 from ..exceptions import GMTInvalidInput
 
 
@@ -33,6 +34,48 @@ def test_figure_region_multiple():
     npt.assert_allclose(fig2.region, np.array([0.0, 360.0, -90.0, 90.0]))
 
 
+def test_figure_active_figure_cache(monkeypatch):
+    "Make sure the 'figure' module is only called when switching figures"
+    figure_calls = []
+    call_module = clib.Session.call_module
+
+    def counting_call_module(self, module, args):
+        "Record the calls to the figure module"
+        if module in ("figure", b"figure"):
+            figure_calls.append(args)
+        return call_module(self, module, args)
+
+    monkeypatch.setattr(clib.Session, "call_module", counting_call_module)
+    fig1 = Figure()
+    assert len(figure_calls) == 1
+    # Plotting repeatedly on the active figure doesn't reselect it
+    fig1.basemap(region=[0, 1, 2, 3], projection="X1i", frame=True)
+    fig1.basemap(region=[0, 1, 2, 3], projection="X1i", frame=True)
+    assert len(figure_calls) == 1
+    fig2 = Figure()
+    fig2.basemap(region=[0, 1, 2, 3], projection="X1i", frame=True)
+    assert len(figure_calls) == 2
+    # Switching back to the first figure selects it exactly once
+    fig1.basemap(region=[0, 1, 2, 3], projection="X1i", frame=True)
+    fig1.basemap(region=[0, 1, 2, 3], projection="X1i", frame=True)
+    assert len(figure_calls) == 3
+
+
+def test_figure_active_figure_call_module():
+    "Plot on the right figure after selecting another one with call_module"
+    fig1 = Figure()
+    fig1.basemap(region=[0, 1, 2, 3], projection="X1id/1id", frame=True)
+    fig2 = Figure()
+    fig2.basemap(region=[4, 5, 6, 7], projection="X1id/1id", frame=True)
+    with clib.Session() as lib:
+        lib.call_module("figure", "{} -".format(fig1._name))
+        assert lib.active_figure == fig1._name
+    # This must reselect fig2 instead of drawing on fig1
+    fig2.basemap(region=[10, 20, 30, 40], projection="X1id/1id", frame=True)
+    npt.assert_allclose(fig1.region, np.array([0, 1, 2, 3]))
+    npt.assert_allclose(fig2.region, np.array([10, 20, 30, 40]))
+
+
 def test_figure_region_country_codes():
     "Extract the plot region for the figure using country codes"
     fig = Figure()
@@ -117,6 +160,21 @@ def test_figure_show():
     assert img.width == 800
 
 
+def test_figure_preview_shared_dir():
+    "Make sure previews of all figures go into the same directory"
+    fig1 = Figure()
+    fig1.basemap(R="10/70/-300/800", J="X3i/5i", B="af")
+    fig2 = Figure()
+    fig2.basemap(R="10/70/-300/800", J="X3i/5i", B="af")
+    fname1 = fig1._preview(fmt="png", dpi=30)
+    fname2 = fig2._preview(fmt="png", dpi=30)
+    assert os.path.dirname(fname1) == os.path.dirname(fname2)
+    assert os.path.exists(fname1)
+    del fig1
+    assert not os.path.exists(fname1)
+    assert os.path.exists(fname2)
+
+
 @pytest.mark.mpl_image_compare
 def test_shift_origin():
     "Test if fig.shift_origin works"
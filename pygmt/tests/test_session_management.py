@@ -5,6 +5,7 @@ import os
 
 from ..session_management import begin, end
 from ..clib import Session
+from ..figure import Figure
 
 
 def test_begin_end():
@@ -22,6 +23,15 @@ def test_begin_end():
     os.remove("pygmt-session.pdf")
 
 
+def test_begin_end_reset_active_figure():
+    "begin and end must forget the active figure of the old session"
+    Figure()
+    end()  # Kill the global session
+    assert Session().active_figure is None
+    begin()  # Restart the global session
+    assert Session().active_figure is None
+
+
 def test_gmt_compat_6_is_applied(capsys):
     """
     Ensure that users with old gmt.conf files won't get pygmt-session [ERROR]: